@@ -4,10 +4,61 @@ from PIL import Image, ImageTk, ImageGrab
 import logging
 import ctypes
 import os
+import threading
+import cv2
+import numpy as np
 from ctypes import wintypes, Structure, c_wchar, sizeof, byref
 
+try:
+    import mss
+except ImportError:
+    mss = None
+
 logger = logging.getLogger('PristonBot')
 
+_mss_local = threading.local()
+
+def _get_mss():
+    """Return this thread's persistent mss instance, creating it on first use."""
+    sct = getattr(_mss_local, 'sct', None)
+    if sct is None:
+        sct = mss.mss()
+        _mss_local.sct = sct
+        # Capture state that survives across frames: the bar rectangles only
+        # change when the user reselects, so the monitor dict handed to grab
+        # is mutated in place rather than rebuilt per call.
+        _mss_local.region = {"left": 0, "top": 0, "width": 0, "height": 0}
+    return sct
+
+def grab_region(x1, y1, x2, y2):
+    """Capture a screen region as an RGB ndarray.
+
+    Prefers mss, which keeps a persistent device context and hands back a
+    raw BGRA buffer, over ImageGrab's per-call BitBlt setup. The detectors
+    all work on NumPy arrays, so the raw buffer is wrapped and converted in
+    one cvtColor pass instead of going through an intermediate PIL image.
+    Falls back to ImageGrab when mss is not installed or fails.
+    """
+    if mss is not None:
+        try:
+            sct = _get_mss()
+            region = _mss_local.region
+            region["left"] = x1
+            region["top"] = y1
+            region["width"] = x2 - x1
+            region["height"] = y2 - y1
+            raw = sct.grab(region)
+            frame = np.frombuffer(raw.bgra, np.uint8).reshape(raw.height, raw.width, 4)
+            return cv2.cvtColor(frame, cv2.COLOR_BGRA2RGB)
+        except Exception as e:
+            logger.debug(f"mss capture failed, falling back to ImageGrab: {e}")
+
+    try:
+        shot = ImageGrab.grab(bbox=(x1, y1, x2, y2), all_screens=True)
+    except TypeError:
+        shot = ImageGrab.grab(bbox=(x1, y1, x2, y2))
+    return np.asarray(shot)
+
 class MONITORINFOEX(Structure):
     _fields_ = [
         ("cbSize", ctypes.c_uint32),
@@ -39,6 +90,11 @@ class EnhancedScreenSelector:
         
         self.completion_callback = None
         self.desktop_bounds = None
+
+        # Validated capture bbox, filled on the first successful capture so
+        # the steady-state path is a dict-free single grab. Reset whenever
+        # the coordinates change.
+        self._cached_bbox = None
         
         try:
             ctypes.windll.shcore.SetProcessDpiAwareness(2)
@@ -63,7 +119,8 @@ class EnhancedScreenSelector:
             self.x2 = int(x2)
             self.y2 = int(y2)
             self.is_configured = True
-            
+            self._cached_bbox = None
+
             title = getattr(self, 'title', 'Selection')
             self.logger.info(f"{title} configured from saved coordinates: ({self.x1},{self.y1}) to ({self.x2},{self.y2})")
             
@@ -370,6 +427,7 @@ class EnhancedScreenSelector:
         
         if confirm:
             self.is_configured = True
+            self._cached_bbox = None
             self.logger.info(f"{self.title} selection confirmed: ({self.x1}, {self.y1}) to ({self.x2}, {self.y2})")
             
             if self.selection_window:
@@ -393,34 +451,135 @@ class EnhancedScreenSelector:
             self.start_y = None
     
     def get_current_screenshot_region(self):
-        if not self.is_configured:
-            self.logger.warning("Cannot capture region: not configured yet")
-            return None
-            
-        if not all([self.x1, self.y1, self.x2, self.y2]):
-            self.logger.warning("Cannot capture region: coordinates not set")
-            return None
-            
-        try:
+        bbox = self._cached_bbox
+
+        if bbox is None:
+            # Validate once; subsequent captures reuse the cached bbox until
+            # the coordinates change.
+            if not self.is_configured:
+                self.logger.warning("Cannot capture region: not configured yet")
+                return None
+
+            if not all([self.x1, self.y1, self.x2, self.y2]):
+                self.logger.warning("Cannot capture region: coordinates not set")
+                return None
+
             if any(coord < -10000 or coord > 10000 for coord in [self.x1, self.y1, self.x2, self.y2]):
                 self.logger.error(f"Coordinates out of range: ({self.x1},{self.y1}) to ({self.x2},{self.y2})")
                 return None
-                
+
             if self.x2 <= self.x1 or self.y2 <= self.y1:
                 self.logger.error(f"Invalid coordinate order: ({self.x1},{self.y1}) to ({self.x2},{self.y2})")
                 return None
-            
+
+            bbox = (self.x1, self.y1, self.x2, self.y2)
+            self._cached_bbox = bbox
+
+        try:
+            screenshot = grab_region(*bbox)
+
+            if screenshot.size == 0:
+                self.logger.error(f"Screenshot has zero dimensions: {screenshot.shape}")
+                return None
+
+            return screenshot
+
+        except Exception as e:
+            self.logger.error(f"Error capturing region: {e}", exc_info=True)
+            return None
+
+class BarRegion:
+    """Lightweight per-bar region backed by a shared EnhancedScreenSelector.
+
+    Holds only the saved coordinates and preview image for one bar. The
+    selection-overlay machinery (full-screen screenshot, canvas, event
+    bindings) lives in the single shared selector, so four bars no longer
+    each carry their own copy of it.
+    """
+
+    def __init__(self, selector):
+        self.selector = selector
+        self.logger = logging.getLogger('PristonBot')
+
+        self.x1 = None
+        self.y1 = None
+        self.x2 = None
+        self.y2 = None
+        self.is_configured = False
+        self.preview_image = None
+        self.title = "Selection"
+        self._cached_bbox = None
+
+    def is_setup(self):
+        return self.is_configured and all([
+            self.x1 is not None,
+            self.y1 is not None,
+            self.x2 is not None,
+            self.y2 is not None
+        ])
+
+    def configure_from_saved(self, x1, y1, x2, y2):
+        if all([x1 is not None, y1 is not None, x2 is not None, y2 is not None]):
+            self.x1 = int(x1)
+            self.y1 = int(y1)
+            self.x2 = int(x2)
+            self.y2 = int(y2)
+            self.is_configured = True
+            self._cached_bbox = None
+
+            self.logger.info(f"{self.title} configured from saved coordinates: ({self.x1},{self.y1}) to ({self.x2},{self.y2})")
+
             try:
-                screenshot = ImageGrab.grab(bbox=(self.x1, self.y1, self.x2, self.y2), all_screens=True)
+                self.preview_image = ImageGrab.grab(bbox=(self.x1, self.y1, self.x2, self.y2), all_screens=True)
             except TypeError:
-                screenshot = ImageGrab.grab(bbox=(self.x1, self.y1, self.x2, self.y2))
-            
-            if screenshot.size[0] == 0 or screenshot.size[1] == 0:
-                self.logger.error(f"Screenshot has zero dimensions: {screenshot.size}")
+                try:
+                    self.preview_image = ImageGrab.grab(bbox=(self.x1, self.y1, self.x2, self.y2))
+                except Exception as e:
+                    self.logger.warning(f"Could not create preview image: {e}")
+            except Exception as e:
+                self.logger.warning(f"Could not create preview image: {e}")
+
+            return True
+        return False
+
+    def start_selection(self, title="Select Area", color="yellow", completion_callback=None):
+        self.title = title
+
+        def on_complete():
+            self.x1 = self.selector.x1
+            self.y1 = self.selector.y1
+            self.x2 = self.selector.x2
+            self.y2 = self.selector.y2
+            self.preview_image = self.selector.preview_image
+            self.is_configured = True
+            self._cached_bbox = None
+
+            if completion_callback:
+                completion_callback()
+
+        return self.selector.start_selection(
+            title=title, color=color, completion_callback=on_complete
+        )
+
+    def get_current_screenshot_region(self):
+        bbox = self._cached_bbox
+
+        if bbox is None:
+            if not self.is_setup():
+                self.logger.warning("Cannot capture region: not configured yet")
                 return None
-                
+            bbox = (self.x1, self.y1, self.x2, self.y2)
+            self._cached_bbox = bbox
+
+        try:
+            screenshot = grab_region(*bbox)
+
+            if screenshot.size == 0:
+                self.logger.error(f"Screenshot has zero dimensions: {screenshot.shape}")
+                return None
+
             return screenshot
-            
+
         except Exception as e:
             self.logger.error(f"Error capturing region: {e}", exc_info=True)
             return None
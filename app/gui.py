@@ -1,11 +1,53 @@
+import os
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
+from tkinter import ttk, messagebox
 import time
+import queue
 import logging
+import collections
 from PIL import Image, ImageTk
 
 logger = logging.getLogger('PristonBot')
 
+# Theme constants - single interned string objects shared by every widget,
+# so Tk does not re-parse a new color literal per configure call.
+BG_DARK = '#1a1a1a'
+BG_PANEL = '#2d2d2d'
+BG_CARD = '#3d3d3d'
+FG_MAIN = '#ffffff'
+FG_MUTED = '#b3b3b3'
+FG_DISABLED = '#666666'
+ACCENT_RED = '#dc3545'
+ACCENT_RED_ACTIVE = '#c82333'
+ACCENT_BLUE = '#007acc'
+ACCENT_GREEN = '#28a745'
+ACCENT_GREEN_ACTIVE = '#218838'
+ACCENT_YELLOW = '#ffc107'
+ACCENT_PURPLE = '#9c27b0'
+ACCENT_PURPLE_ACTIVE = '#7b1fa2'
+ACCENT_GRAY = '#6c757d'
+ACCENT_GRAY_ACTIVE = '#5a6268'
+ACCENT_TEAL = '#17a2b8'
+ACCENT_TEAL_ACTIVE = '#138496'
+
+# Oldest log lines are dropped above this so the log widget stays bounded
+# over a long bot session.
+MAX_LOG_LINES = 2000
+
+# strftime walks the format string and queries the locale on every call;
+# log lines only need second resolution, so cache the rendered timestamp
+# per whole-second bucket.
+_ts_bucket = -1
+_ts_str = ""
+
+def _now_hms():
+    global _ts_bucket, _ts_str
+    now = int(time.time())
+    if now != _ts_bucket:
+        _ts_bucket = now
+        _ts_str = time.strftime("%H:%M:%S")
+    return _ts_str
+
 class PristonTaleBot:
     def __init__(self, root):
         logger.info("Initializing Enhanced Priston Tale Bot")
@@ -23,12 +65,25 @@ class PristonTaleBot:
         self.root.geometry("1300x900")
         self.root.minsize(1100, 800)
         self.root.title("Priston Tale Bot - Enhanced")
-        self.root.configure(bg="#1a1a1a")
+        self.root.configure(bg=BG_DARK)
         
+        self._ui_queue = queue.SimpleQueue()
+        self._log_queue = collections.deque()
+        self._log_flush_scheduled = False
+
+        # Config dict is loaded from disk once and reused on every save;
+        # the mtime lets us detect the file changing underneath us.
+        self._config_cache = None
+        self._config_mtime = None
+        self._config_dirty = False
+        self._config_save_scheduled = False
+
         self._initialize_screen_selectors()
         self._initialize_bot_system()
         self._create_interface()
-        
+
+        self.root.after(50, self._drain_ui_queue)
+
         self.log("Enhanced Bot interface initialized")
         self._load_configuration()
         self.check_bar_config()
@@ -38,14 +93,15 @@ class PristonTaleBot:
     
     def _initialize_screen_selectors(self):
         try:
-            from app.bar_selector.screen_selector import EnhancedScreenSelector
-            
-            self.hp_bar_selector = EnhancedScreenSelector(self.root)
-            self.mp_bar_selector = EnhancedScreenSelector(self.root)
-            self.sp_bar_selector = EnhancedScreenSelector(self.root)
-            self.largato_skill_selector = EnhancedScreenSelector(self.root)
-            
-            logger.info("Enhanced screen selectors initialized")
+            from app.bar_selector.screen_selector import EnhancedScreenSelector, BarRegion
+
+            self._shared_selector = EnhancedScreenSelector(self.root)
+            self.hp_bar_selector = BarRegion(self._shared_selector)
+            self.mp_bar_selector = BarRegion(self._shared_selector)
+            self.sp_bar_selector = BarRegion(self._shared_selector)
+            self.largato_skill_selector = BarRegion(self._shared_selector)
+
+            logger.info("Enhanced screen selectors initialized (shared selection engine)")
             
         except ImportError as e:
             logger.error(f"Failed to import EnhancedScreenSelector: {e}")
@@ -58,7 +114,16 @@ class PristonTaleBot:
             self.largato_skill_selector = ScreenSelector(self.root)
             
             logger.info("Fallback screen selectors initialized")
-    
+
+        # One name -> selector table shared by the config load and save
+        # paths, built once instead of two parallel literals per call.
+        self._bar_selectors = (
+            ("health_bar", self.hp_bar_selector),
+            ("mana_bar", self.mp_bar_selector),
+            ("stamina_bar", self.sp_bar_selector),
+            ("largato_skill_bar", self.largato_skill_selector)
+        )
+
     def _initialize_bot_system(self):
         try:
             from app.bar_selector.bar_detector import EnhancedBarDetector, HEALTH_COLOR_RANGE, MANA_COLOR_RANGE, STAMINA_COLOR_RANGE
@@ -76,16 +141,18 @@ class PristonTaleBot:
         self.running = False
         self.largato_running = False
         self.start_time = None
-        
-        self.hp_potions_used = 0
-        self.mp_potions_used = 0
-        self.sp_potions_used = 0
-        self.spells_cast = 0
+
+        # Tk variables so stat labels redraw only when a counter actually
+        # changes, instead of a periodic refresh rewriting every label.
+        self.hp_potions_used = tk.IntVar(value=0)
+        self.mp_potions_used = tk.IntVar(value=0)
+        self.sp_potions_used = tk.IntVar(value=0)
+        self.spells_cast = tk.IntVar(value=0)
     
     def _create_interface(self):
-        main_canvas = tk.Canvas(self.root, bg="#1a1a1a", highlightthickness=0)
+        main_canvas = tk.Canvas(self.root, bg=BG_DARK, highlightthickness=0)
         main_scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=main_canvas.yview)
-        scrollable_main = tk.Frame(main_canvas, bg="#1a1a1a")
+        scrollable_main = tk.Frame(main_canvas, bg=BG_DARK)
         
         scrollable_main.bind(
             "<Configure>",
@@ -103,59 +170,59 @@ class PristonTaleBot:
         
         main_canvas.bind_all("<MouseWheel>", _on_mousewheel)
         
-        main_container = tk.Frame(scrollable_main, bg="#1a1a1a")
+        main_container = tk.Frame(scrollable_main, bg=BG_DARK)
         main_container.pack(fill=tk.BOTH, expand=True, padx=12, pady=12)
         
         self._create_header(main_container)
         self._create_content_area(main_container)
     
     def _create_header(self, parent):
-        header_frame = tk.Frame(parent, bg="#1a1a1a", height=70)
+        header_frame = tk.Frame(parent, bg=BG_DARK, height=70)
         header_frame.pack(fill=tk.X, pady=(0, 12))
         header_frame.pack_propagate(False)
         
-        title_section = tk.Frame(header_frame, bg="#1a1a1a")
+        title_section = tk.Frame(header_frame, bg=BG_DARK)
         title_section.pack(side=tk.LEFT, fill=tk.Y, pady=8)
         
         title_label = tk.Label(title_section, text="Priston Tale Bot", 
-                              font=("Segoe UI", 20, "bold"), bg="#1a1a1a", fg="#ffffff")
+                              font=("Segoe UI", 20, "bold"), bg=BG_DARK, fg=FG_MAIN)
         title_label.pack(anchor=tk.W)
         
         subtitle_label = tk.Label(title_section, text="Enhanced Automation Suite", 
-                                 font=("Segoe UI", 12), bg="#1a1a1a", fg="#007acc")
+                                 font=("Segoe UI", 12), bg=BG_DARK, fg=ACCENT_BLUE)
         subtitle_label.pack(anchor=tk.W)
         
-        status_section = tk.Frame(header_frame, bg="#1a1a1a")
+        status_section = tk.Frame(header_frame, bg=BG_DARK)
         status_section.pack(side=tk.RIGHT, fill=tk.Y, pady=8)
         
-        status_frame = tk.Frame(status_section, bg="#1a1a1a")
+        status_frame = tk.Frame(status_section, bg=BG_DARK)
         status_frame.pack(side=tk.RIGHT, padx=(20, 0))
         
         status_label = tk.Label(status_frame, text="Status:", 
-                               font=("Segoe UI", 10), bg="#1a1a1a", fg="#b3b3b3")
+                               font=("Segoe UI", 10), bg=BG_DARK, fg=FG_MUTED)
         status_label.pack(side=tk.LEFT)
         
         self.status_indicator = tk.Label(status_frame, text="●", 
-                                       font=("Segoe UI", 16), bg="#1a1a1a", fg="#28a745")
+                                       font=("Segoe UI", 16), bg=BG_DARK, fg=ACCENT_GREEN)
         self.status_indicator.pack(side=tk.LEFT, padx=(5, 0))
         
         self.status_text = tk.Label(status_frame, text="Ready", 
-                                   font=("Segoe UI", 10, "bold"), bg="#1a1a1a", fg="#28a745")
+                                   font=("Segoe UI", 10, "bold"), bg=BG_DARK, fg=ACCENT_GREEN)
         self.status_text.pack(side=tk.LEFT, padx=(5, 0))
     
     def _create_content_area(self, parent):
-        content_frame = tk.Frame(parent, bg="#1a1a1a")
+        content_frame = tk.Frame(parent, bg=BG_DARK)
         content_frame.pack(fill=tk.BOTH, expand=True)
         
         content_frame.grid_rowconfigure(0, weight=1)
         content_frame.grid_columnconfigure(0, weight=2)
         content_frame.grid_columnconfigure(1, weight=1)
         
-        left_panel = tk.Frame(content_frame, bg="#2d2d2d", relief=tk.FLAT, bd=1)
+        left_panel = tk.Frame(content_frame, bg=BG_PANEL, relief=tk.FLAT, bd=1)
         left_panel.grid(row=0, column=0, sticky="nsew", padx=(0, 6))
         left_panel.grid_rowconfigure(1, weight=1)
         
-        right_panel = tk.Frame(content_frame, bg="#2d2d2d", relief=tk.FLAT, bd=1)
+        right_panel = tk.Frame(content_frame, bg=BG_PANEL, relief=tk.FLAT, bd=1)
         right_panel.grid(row=0, column=1, sticky="nsew")
         right_panel.grid_rowconfigure(0, weight=2)
         right_panel.grid_rowconfigure(1, weight=1)
@@ -166,134 +233,143 @@ class PristonTaleBot:
         self._create_controls_panel(right_panel)
     
     def _create_bar_selection_panel(self, parent):
-        bars_frame = tk.Frame(parent, bg="#2d2d2d", padx=12, pady=12)
+        bars_frame = tk.Frame(parent, bg=BG_PANEL, padx=12, pady=12)
         bars_frame.grid(row=0, column=0, sticky="ew", pady=(0, 6))
         
         title_label = tk.Label(bars_frame, text="Bar Configuration", 
-                              font=("Segoe UI", 14, "bold"), bg="#2d2d2d", fg="#ffffff")
+                              font=("Segoe UI", 14, "bold"), bg=BG_PANEL, fg=FG_MAIN)
         title_label.pack(anchor=tk.W, pady=(0, 12))
         
-        bars_grid = tk.Frame(bars_frame, bg="#2d2d2d")
+        bars_grid = tk.Frame(bars_frame, bg=BG_PANEL)
         bars_grid.pack(fill=tk.X)
         
-        main_bars = tk.Frame(bars_grid, bg="#2d2d2d")
+        main_bars = tk.Frame(bars_grid, bg=BG_PANEL)
         main_bars.pack(fill=tk.X, pady=(0, 8))
         
         for i, (name, color, selector) in enumerate([
-            ("Health Bar", "#dc3545", self.hp_bar_selector),
-            ("Mana Bar", "#007acc", self.mp_bar_selector),
-            ("Stamina Bar", "#28a745", self.sp_bar_selector)
+            ("Health Bar", ACCENT_RED, self.hp_bar_selector),
+            ("Mana Bar", ACCENT_BLUE, self.mp_bar_selector),
+            ("Stamina Bar", ACCENT_GREEN, self.sp_bar_selector)
         ]):
             main_bars.grid_columnconfigure(i, weight=1, uniform="bar")
             self._create_bar_card(main_bars, name, color, selector, 0, i)
         
-        skill_frame = tk.Frame(bars_grid, bg="#2d2d2d")
+        skill_frame = tk.Frame(bars_grid, bg=BG_PANEL)
         skill_frame.pack(fill=tk.X)
         
         self._create_skill_card(skill_frame)
         
         self.config_status_label = tk.Label(bars_frame, text="Configure bars to continue",
-                                           font=("Segoe UI", 11), bg="#2d2d2d", fg="#ffc107")
+                                           font=("Segoe UI", 11), bg=BG_PANEL, fg=ACCENT_YELLOW)
         self.config_status_label.pack(pady=(12, 0))
     
     def _create_bar_card(self, parent, title, color, selector, row, col):
-        card = tk.Frame(parent, bg="#3d3d3d", relief=tk.FLAT, bd=1)
+        card = tk.Frame(parent, bg=BG_CARD, relief=tk.FLAT, bd=1)
         card.grid(row=row, column=col, padx=4, pady=4, sticky="nsew")
         
-        header = tk.Frame(card, bg="#3d3d3d")
+        header = tk.Frame(card, bg=BG_CARD)
         header.pack(fill=tk.X, padx=8, pady=(8, 4))
         
         title_label = tk.Label(header, text=title, font=("Segoe UI", 10, "bold"), 
-                              bg="#3d3d3d", fg="#ffffff")
+                              bg=BG_CARD, fg=FG_MAIN)
         title_label.pack(side=tk.LEFT)
         
         status_dot = tk.Label(header, text="●", font=("Segoe UI", 12), 
-                             bg="#3d3d3d", fg="#dc3545")
+                             bg=BG_CARD, fg=ACCENT_RED)
         status_dot.pack(side=tk.RIGHT)
         setattr(selector, 'status_dot', status_dot)
         
-        preview_frame = tk.Frame(card, bg="#1a1a1a", height=50)
+        preview_frame = tk.Frame(card, bg=BG_DARK, height=50)
         preview_frame.pack(fill=tk.X, padx=8, pady=4)
         preview_frame.pack_propagate(False)
         
         preview_label = tk.Label(preview_frame, text="Not Configured",
-                               bg="#1a1a1a", fg="#666666", font=("Segoe UI", 9))
+                               bg=BG_DARK, fg=FG_DISABLED, font=("Segoe UI", 9))
         preview_label.pack(expand=True)
         setattr(selector, 'preview_label', preview_label)
         
-        btn_frame = tk.Frame(card, bg="#3d3d3d")
+        btn_frame = tk.Frame(card, bg=BG_CARD)
         btn_frame.pack(fill=tk.X, padx=8, pady=(4, 8))
         
         select_btn = tk.Button(btn_frame, text=f"Select {title}",
-                             bg=color, fg="#ffffff", relief=tk.FLAT, borderwidth=0,
+                             bg=color, fg=FG_MAIN, relief=tk.FLAT, borderwidth=0,
                              font=("Segoe UI", 9), activebackground=color,
                              command=lambda: self.start_bar_selection(title, color, selector))
         select_btn.pack(fill=tk.X)
     
     def _create_skill_card(self, parent):
-        card = tk.Frame(parent, bg="#3d3d3d", relief=tk.FLAT, bd=1)
+        card = tk.Frame(parent, bg=BG_CARD, relief=tk.FLAT, bd=1)
         card.pack(fill=tk.X, padx=4, pady=4)
         
-        header = tk.Frame(card, bg="#3d3d3d")
+        header = tk.Frame(card, bg=BG_CARD)
         header.pack(fill=tk.X, padx=12, pady=(12, 8))
         
         title_label = tk.Label(header, text="Largato Skill Bar", 
-                              font=("Segoe UI", 11, "bold"), bg="#3d3d3d", fg="#ffffff")
+                              font=("Segoe UI", 11, "bold"), bg=BG_CARD, fg=FG_MAIN)
         title_label.pack(side=tk.LEFT)
         
         optional_label = tk.Label(header, text="(Optional - for Largato Hunt)", 
-                                 font=("Segoe UI", 9), bg="#3d3d3d", fg="#ffc107")
+                                 font=("Segoe UI", 9), bg=BG_CARD, fg=ACCENT_YELLOW)
         optional_label.pack(side=tk.LEFT, padx=(8, 0))
         
         status_dot = tk.Label(header, text="●", font=("Segoe UI", 12), 
-                             bg="#3d3d3d", fg="#dc3545")
+                             bg=BG_CARD, fg=ACCENT_RED)
         status_dot.pack(side=tk.RIGHT)
         setattr(self.largato_skill_selector, 'status_dot', status_dot)
         
-        content = tk.Frame(card, bg="#3d3d3d")
+        content = tk.Frame(card, bg=BG_CARD)
         content.pack(fill=tk.X, padx=12, pady=(0, 12))
         
-        preview_frame = tk.Frame(content, bg="#1a1a1a", width=100, height=40)
+        preview_frame = tk.Frame(content, bg=BG_DARK, width=100, height=40)
         preview_frame.pack(side=tk.LEFT, padx=(0, 12))
         preview_frame.pack_propagate(False)
         
         preview_label = tk.Label(preview_frame, text="Not Configured",
-                               bg="#1a1a1a", fg="#666666", font=("Segoe UI", 9))
+                               bg=BG_DARK, fg=FG_DISABLED, font=("Segoe UI", 9))
         preview_label.pack(expand=True)
         setattr(self.largato_skill_selector, 'preview_label', preview_label)
         
         select_btn = tk.Button(content, text="Select Largato Skill Bar",
-                             bg="#9c27b0", fg="#ffffff", relief=tk.FLAT, borderwidth=0,
-                             font=("Segoe UI", 10), activebackground="#7b1fa2",
-                             command=lambda: self.start_bar_selection("Largato Skill Bar", "#9c27b0", self.largato_skill_selector))
+                             bg=ACCENT_PURPLE, fg=FG_MAIN, relief=tk.FLAT, borderwidth=0,
+                             font=("Segoe UI", 10), activebackground=ACCENT_PURPLE_ACTIVE,
+                             command=lambda: self.start_bar_selection("Largato Skill Bar", ACCENT_PURPLE, self.largato_skill_selector))
         select_btn.pack(side=tk.LEFT, fill=tk.X, expand=True)
     
     def _create_log_panel(self, parent):
-        log_frame = tk.Frame(parent, bg="#2d2d2d", padx=12, pady=12)
+        log_frame = tk.Frame(parent, bg=BG_PANEL, padx=12, pady=12)
         log_frame.grid(row=1, column=0, sticky="nsew")
         log_frame.grid_rowconfigure(1, weight=1)
         
         title_label = tk.Label(log_frame, text="Activity Log", 
-                              font=("Segoe UI", 14, "bold"), bg="#2d2d2d", fg="#ffffff")
+                              font=("Segoe UI", 14, "bold"), bg=BG_PANEL, fg=FG_MAIN)
         title_label.grid(row=0, column=0, sticky="w", pady=(0, 8))
-        
-        self.log_text = scrolledtext.ScrolledText(
-            log_frame, bg="#1a1a1a", fg="#ffffff", insertbackground="#ffffff",
-            selectbackground="#007acc", selectforeground="#ffffff",
-            relief=tk.FLAT, borderwidth=0, font=("Consolas", 10), wrap=tk.WORD
+
+        log_frame.grid_columnconfigure(0, weight=1)
+
+        # Plain Text with undo disabled - ScrolledText's undo history keeps
+        # every insert alive and grows without bound in a long session.
+        self.log_text = tk.Text(
+            log_frame, bg=BG_DARK, fg=FG_MAIN, insertbackground=FG_MAIN,
+            selectbackground=ACCENT_BLUE, selectforeground=FG_MAIN,
+            relief=tk.FLAT, borderwidth=0, font=("Consolas", 10), wrap=tk.WORD,
+            undo=False, autoseparators=False, maxundo=0, state=tk.DISABLED
         )
         self.log_text.grid(row=1, column=0, sticky="nsew")
+
+        log_scrollbar = ttk.Scrollbar(log_frame, orient="vertical", command=self.log_text.yview)
+        log_scrollbar.grid(row=1, column=1, sticky="ns")
+        self.log_text.configure(yscrollcommand=log_scrollbar.set)
     
     def _create_settings_panel(self, parent):
-        settings_frame = tk.Frame(parent, bg="#2d2d2d", padx=12, pady=12)
+        settings_frame = tk.Frame(parent, bg=BG_PANEL, padx=12, pady=12)
         settings_frame.grid(row=0, column=0, sticky="nsew")
         settings_frame.grid_rowconfigure(1, weight=1)
         
         title_label = tk.Label(settings_frame, text="Bot Settings", 
-                              font=("Segoe UI", 14, "bold"), bg="#2d2d2d", fg="#ffffff")
+                              font=("Segoe UI", 14, "bold"), bg=BG_PANEL, fg=FG_MAIN)
         title_label.grid(row=0, column=0, sticky="w", pady=(0, 8))
         
-        settings_content = tk.Frame(settings_frame, bg="#2d2d2d")
+        settings_content = tk.Frame(settings_frame, bg=BG_PANEL)
         settings_content.grid(row=1, column=0, sticky="nsew", pady=(0, 8))
         
         self._create_potion_settings(settings_content)
@@ -301,21 +377,21 @@ class PristonTaleBot:
         self._create_spellcasting_settings(settings_content)
     
     def _create_potion_settings(self, parent):
-        frame = tk.LabelFrame(parent, text="Potion Settings", bg="#2d2d2d", fg="#ffffff", 
+        frame = tk.LabelFrame(parent, text="Potion Settings", bg=BG_PANEL, fg=FG_MAIN, 
                              font=("Segoe UI", 10, "bold"))
         frame.pack(fill=tk.X, padx=4, pady=(0, 8))
         
-        keys_frame = tk.Frame(frame, bg="#2d2d2d")
+        keys_frame = tk.Frame(frame, bg=BG_PANEL)
         keys_frame.pack(fill=tk.X, padx=8, pady=8)
         
         for i, (name, color, default) in enumerate([
-            ("HP:", "#dc3545", "1"),
-            ("MP:", "#007acc", "3"),
-            ("SP:", "#28a745", "2")
+            ("HP:", ACCENT_RED, "1"),
+            ("MP:", ACCENT_BLUE, "3"),
+            ("SP:", ACCENT_GREEN, "2")
         ]):
             keys_frame.grid_columnconfigure(i*2+1, weight=1)
             
-            tk.Label(keys_frame, text=name, bg="#2d2d2d", fg=color,
+            tk.Label(keys_frame, text=name, bg=BG_PANEL, fg=color,
                     font=("Segoe UI", 9, "bold")).grid(row=0, column=i*2, sticky="e", padx=(0, 4))
             
             var = tk.StringVar(value=default)
@@ -324,27 +400,27 @@ class PristonTaleBot:
             combo.grid(row=0, column=i*2+1, sticky="w", padx=(0, 12))
             setattr(self, f"{name[:-1].lower()}_key_var", var)
         
-        thresholds_frame = tk.Frame(frame, bg="#2d2d2d")
+        thresholds_frame = tk.Frame(frame, bg=BG_PANEL)
         thresholds_frame.pack(fill=tk.X, padx=8, pady=(0, 8))
         
         for i, (name, color, default) in enumerate([
-            ("Health:", "#dc3545", 50),
-            ("Mana:", "#007acc", 30),
-            ("Stamina:", "#28a745", 40)
+            ("Health:", ACCENT_RED, 50),
+            ("Mana:", ACCENT_BLUE, 30),
+            ("Stamina:", ACCENT_GREEN, 40)
         ]):
-            row_frame = tk.Frame(thresholds_frame, bg="#2d2d2d")
+            row_frame = tk.Frame(thresholds_frame, bg=BG_PANEL)
             row_frame.pack(fill=tk.X, pady=1)
             
-            tk.Label(row_frame, text=name, bg="#2d2d2d", fg=color,
+            tk.Label(row_frame, text=name, bg=BG_PANEL, fg=color,
                     font=("Segoe UI", 9, "bold")).pack(side=tk.LEFT)
             
             scale = tk.Scale(row_frame, from_=0, to=100, orient=tk.HORIZONTAL,
-                           bg="#2d2d2d", fg="#ffffff", troughcolor="#1a1a1a",
+                           bg=BG_PANEL, fg=FG_MAIN, troughcolor=BG_DARK,
                            highlightthickness=0, activebackground=color)
             scale.set(default)
             scale.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 4))
             
-            label = tk.Label(row_frame, text=f"{default}%", bg="#2d2d2d", fg=color,
+            label = tk.Label(row_frame, text=f"{default}%", bg=BG_PANEL, fg=color,
                            font=("Segoe UI", 9, "bold"), width=5)
             label.pack(side=tk.RIGHT)
             
@@ -352,57 +428,57 @@ class PristonTaleBot:
             setattr(self, f"{name[:-1].lower()}_threshold", scale)
     
     def _create_behavior_settings(self, parent):
-        frame = tk.LabelFrame(parent, text="Bot Behavior", bg="#2d2d2d", fg="#ffffff", 
+        frame = tk.LabelFrame(parent, text="Bot Behavior", bg=BG_PANEL, fg=FG_MAIN, 
                              font=("Segoe UI", 10, "bold"))
         frame.pack(fill=tk.X, padx=4, pady=(0, 8))
         
-        scan_frame = tk.Frame(frame, bg="#2d2d2d")
+        scan_frame = tk.Frame(frame, bg=BG_PANEL)
         scan_frame.pack(fill=tk.X, padx=8, pady=8)
         
-        tk.Label(scan_frame, text="Scan Interval:", bg="#2d2d2d", fg="#ffffff",
+        tk.Label(scan_frame, text="Scan Interval:", bg=BG_PANEL, fg=FG_MAIN,
                 font=("Segoe UI", 9)).pack(side=tk.LEFT)
         
         self.scan_interval = tk.Scale(scan_frame, from_=0.1, to=2.0, resolution=0.1,
-                                    orient=tk.HORIZONTAL, bg="#2d2d2d", fg="#ffffff",
-                                    troughcolor="#1a1a1a", highlightthickness=0)
+                                    orient=tk.HORIZONTAL, bg=BG_PANEL, fg=FG_MAIN,
+                                    troughcolor=BG_DARK, highlightthickness=0)
         self.scan_interval.set(0.5)
         self.scan_interval.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 4))
         
-        self.scan_label = tk.Label(scan_frame, text="0.5s", bg="#2d2d2d", fg="#ffffff",
+        self.scan_label = tk.Label(scan_frame, text="0.5s", bg=BG_PANEL, fg=FG_MAIN,
                                  font=("Segoe UI", 9), width=5)
         self.scan_label.pack(side=tk.RIGHT)
         
         self.scan_interval.bind("<Motion>", lambda e: self.scan_label.config(text=f"{self.scan_interval.get()}s"))
         
-        debug_frame = tk.Frame(frame, bg="#2d2d2d")
+        debug_frame = tk.Frame(frame, bg=BG_PANEL)
         debug_frame.pack(fill=tk.X, padx=8, pady=(0, 8))
         
         self.debug_var = tk.BooleanVar()
         debug_check = tk.Checkbutton(debug_frame, text="Enable debug mode",
-                                   variable=self.debug_var, bg="#2d2d2d", fg="#ffffff",
-                                   selectcolor="#1a1a1a", activebackground="#2d2d2d",
-                                   activeforeground="#ffffff", font=("Segoe UI", 9))
+                                   variable=self.debug_var, bg=BG_PANEL, fg=FG_MAIN,
+                                   selectcolor=BG_DARK, activebackground=BG_PANEL,
+                                   activeforeground=FG_MAIN, font=("Segoe UI", 9))
         debug_check.pack(side=tk.LEFT)
     
     def _create_spellcasting_settings(self, parent):
-        frame = tk.LabelFrame(parent, text="Spellcasting", bg="#2d2d2d", fg="#ffffff", 
+        frame = tk.LabelFrame(parent, text="Spellcasting", bg=BG_PANEL, fg=FG_MAIN, 
                              font=("Segoe UI", 10, "bold"))
         frame.pack(fill=tk.X, padx=4, pady=(0, 8))
         
-        enable_frame = tk.Frame(frame, bg="#2d2d2d")
+        enable_frame = tk.Frame(frame, bg=BG_PANEL)
         enable_frame.pack(fill=tk.X, padx=8, pady=8)
         
         self.spellcasting_var = tk.BooleanVar()
         spell_check = tk.Checkbutton(enable_frame, text="Enable spellcasting",
-                                   variable=self.spellcasting_var, bg="#2d2d2d", fg="#ffffff",
-                                   selectcolor="#1a1a1a", activebackground="#2d2d2d",
-                                   activeforeground="#ffffff", font=("Segoe UI", 9, "bold"))
+                                   variable=self.spellcasting_var, bg=BG_PANEL, fg=FG_MAIN,
+                                   selectcolor=BG_DARK, activebackground=BG_PANEL,
+                                   activeforeground=FG_MAIN, font=("Segoe UI", 9, "bold"))
         spell_check.pack(side=tk.LEFT)
         
-        controls_frame = tk.Frame(frame, bg="#2d2d2d")
+        controls_frame = tk.Frame(frame, bg=BG_PANEL)
         controls_frame.pack(fill=tk.X, padx=8, pady=(0, 8))
         
-        tk.Label(controls_frame, text="Key:", bg="#2d2d2d", fg="#ffffff",
+        tk.Label(controls_frame, text="Key:", bg=BG_PANEL, fg=FG_MAIN,
                 font=("Segoe UI", 9)).pack(side=tk.LEFT)
         
         self.spell_key_var = tk.StringVar(value="F4")
@@ -411,103 +487,103 @@ class PristonTaleBot:
                                  state="readonly", width=6)
         spell_combo.pack(side=tk.LEFT, padx=(4, 12))
         
-        tk.Label(controls_frame, text="Interval:", bg="#2d2d2d", fg="#ffffff",
+        tk.Label(controls_frame, text="Interval:", bg=BG_PANEL, fg=FG_MAIN,
                 font=("Segoe UI", 9)).pack(side=tk.LEFT)
         
         self.spell_interval = tk.Scale(controls_frame, from_=1, to=10, resolution=0.1,
-                                     orient=tk.HORIZONTAL, bg="#2d2d2d", fg="#ffffff",
-                                     troughcolor="#1a1a1a", highlightthickness=0)
+                                     orient=tk.HORIZONTAL, bg=BG_PANEL, fg=FG_MAIN,
+                                     troughcolor=BG_DARK, highlightthickness=0)
         self.spell_interval.set(3.7)
         self.spell_interval.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(4, 4))
         
-        self.spell_label = tk.Label(controls_frame, text="3.7s", bg="#2d2d2d", fg="#ffffff",
+        self.spell_label = tk.Label(controls_frame, text="3.7s", bg=BG_PANEL, fg=FG_MAIN,
                                    font=("Segoe UI", 9), width=5)
         self.spell_label.pack(side=tk.RIGHT)
         
         self.spell_interval.bind("<Motion>", lambda e: self.spell_label.config(text=f"{self.spell_interval.get()}s"))
     
     def _create_controls_panel(self, parent):
-        controls_frame = tk.Frame(parent, bg="#2d2d2d", padx=12, pady=12)
+        controls_frame = tk.Frame(parent, bg=BG_PANEL, padx=12, pady=12)
         controls_frame.grid(row=1, column=0, sticky="ew")
         controls_frame.grid_columnconfigure(0, weight=1)
         controls_frame.grid_columnconfigure(1, weight=1)
         
-        bot_frame = tk.Frame(controls_frame, bg="#2d2d2d")
+        bot_frame = tk.Frame(controls_frame, bg=BG_PANEL)
         bot_frame.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 8))
         bot_frame.grid_columnconfigure(0, weight=1)
         bot_frame.grid_columnconfigure(1, weight=1)
         
         self.start_btn = tk.Button(bot_frame, text="START BOT",
-                                 bg="#28a745", fg="#ffffff", relief=tk.FLAT, borderwidth=0,
+                                 bg=ACCENT_GREEN, fg=FG_MAIN, relief=tk.FLAT, borderwidth=0,
                                  font=("Segoe UI", 12, "bold"), height=2, state=tk.DISABLED,
-                                 activebackground="#218838", command=self.start_bot)
+                                 activebackground=ACCENT_GREEN_ACTIVE, command=self.start_bot)
         self.start_btn.grid(row=0, column=0, sticky="ew", padx=(0, 4))
         
         self.stop_btn = tk.Button(bot_frame, text="STOP BOT",
-                                bg="#dc3545", fg="#ffffff", relief=tk.FLAT, borderwidth=0,
+                                bg=ACCENT_RED, fg=FG_MAIN, relief=tk.FLAT, borderwidth=0,
                                 font=("Segoe UI", 12, "bold"), height=2, state=tk.DISABLED,
-                                activebackground="#c82333", command=self.stop_bot)
+                                activebackground=ACCENT_RED_ACTIVE, command=self.stop_bot)
         self.stop_btn.grid(row=0, column=1, sticky="ew", padx=(4, 0))
         
         self.largato_btn = tk.Button(controls_frame, text="LARGATO HUNT",
-                                   bg="#9c27b0", fg="#ffffff", relief=tk.FLAT, borderwidth=0,
+                                   bg=ACCENT_PURPLE, fg=FG_MAIN, relief=tk.FLAT, borderwidth=0,
                                    font=("Segoe UI", 11, "bold"), height=2, state=tk.DISABLED,
-                                   activebackground="#7b1fa2", command=self.start_largato_hunt)
+                                   activebackground=ACCENT_PURPLE_ACTIVE, command=self.start_largato_hunt)
         self.largato_btn.grid(row=1, column=0, columnspan=2, sticky="ew", pady=(0, 8))
         
-        stats_frame = tk.Frame(controls_frame, bg="#2d2d2d")
+        stats_frame = tk.Frame(controls_frame, bg=BG_PANEL)
         stats_frame.grid(row=2, column=0, columnspan=2, sticky="ew", pady=(0, 8))
         
         self._create_stats_display(stats_frame)
         
-        actions_frame = tk.Frame(controls_frame, bg="#2d2d2d")
+        actions_frame = tk.Frame(controls_frame, bg=BG_PANEL)
         actions_frame.grid(row=3, column=0, columnspan=2, sticky="ew")
         actions_frame.grid_columnconfigure(0, weight=1)
         actions_frame.grid_columnconfigure(1, weight=1)
         
         reset_btn = tk.Button(actions_frame, text="Reset Stats",
-                             bg="#6c757d", fg="#ffffff", relief=tk.FLAT, borderwidth=0,
-                             font=("Segoe UI", 10), height=1, activebackground="#5a6268",
+                             bg=ACCENT_GRAY, fg=FG_MAIN, relief=tk.FLAT, borderwidth=0,
+                             font=("Segoe UI", 10), height=1, activebackground=ACCENT_GRAY_ACTIVE,
                              command=self.reset_stats)
         reset_btn.grid(row=0, column=0, sticky="ew", padx=(0, 4))
         
         save_btn = tk.Button(actions_frame, text="Save Settings",
-                           bg="#17a2b8", fg="#ffffff", relief=tk.FLAT, borderwidth=0,
-                           font=("Segoe UI", 10), height=1, activebackground="#138496",
+                           bg=ACCENT_TEAL, fg=FG_MAIN, relief=tk.FLAT, borderwidth=0,
+                           font=("Segoe UI", 10), height=1, activebackground=ACCENT_TEAL_ACTIVE,
                            command=self.save_settings)
         save_btn.grid(row=0, column=1, sticky="ew", padx=(4, 0))
     
     def _create_stats_display(self, parent):
-        stats_grid = tk.Frame(parent, bg="#2d2d2d")
+        stats_grid = tk.Frame(parent, bg=BG_PANEL)
         stats_grid.pack(fill=tk.X)
         
         for i in range(3):
             stats_grid.grid_columnconfigure(i, weight=1)
         
+        self.uptime_var = tk.StringVar(value="00:00:00")
+        self.round_var = tk.StringVar(value="1")
+
         labels = [
-            ("HP Potions:", "#dc3545", "hp_potions_var"),
-            ("MP Potions:", "#007acc", "mp_potions_var"),
-            ("SP Potions:", "#28a745", "sp_potions_var"),
-            ("Spells Cast:", "#ffffff", "spells_var"),
-            ("Uptime:", "#ffffff", "uptime_var"),
-            ("Round:", "#9c27b0", "round_var")
+            ("HP Potions:", ACCENT_RED, self.hp_potions_used),
+            ("MP Potions:", ACCENT_BLUE, self.mp_potions_used),
+            ("SP Potions:", ACCENT_GREEN, self.sp_potions_used),
+            ("Spells Cast:", FG_MAIN, self.spells_cast),
+            ("Uptime:", FG_MAIN, self.uptime_var),
+            ("Round:", ACCENT_PURPLE, self.round_var)
         ]
-        
-        for i, (text, color, var_name) in enumerate(labels):
+
+        for i, (text, color, var) in enumerate(labels):
             row, col = divmod(i, 3)
-            
-            frame = tk.Frame(stats_grid, bg="#2d2d2d")
+
+            frame = tk.Frame(stats_grid, bg=BG_PANEL)
             frame.grid(row=row, column=col, sticky="ew", padx=1, pady=1)
-            
-            tk.Label(frame, text=text, bg="#2d2d2d", fg=color,
+
+            tk.Label(frame, text=text, bg=BG_PANEL, fg=color,
                     font=("Segoe UI", 9, "bold")).pack(side=tk.LEFT)
-            
-            var = tk.StringVar(value="0" if "var" not in var_name.replace("uptime", "time").replace("round", "1") else ("00:00:00" if "uptime" in var_name else "1"))
-            label = tk.Label(frame, textvariable=var, bg="#2d2d2d", fg="#ffffff",
+
+            label = tk.Label(frame, textvariable=var, bg=BG_PANEL, fg=FG_MAIN,
                            font=("Segoe UI", 9))
             label.pack(side=tk.RIGHT)
-            
-            setattr(self, var_name, var)
     
     def start_bar_selection(self, title, color, selector):
         self.log(f"Starting {title} selection...")
@@ -534,8 +610,8 @@ class PristonTaleBot:
     def update_bar_status(self, selector):
         if hasattr(selector, 'status_dot') and hasattr(selector, 'preview_label'):
             if selector.is_setup():
-                selector.status_dot.config(fg="#28a745")
-                selector.preview_label.config(text="Configured", fg="#28a745")
+                selector.status_dot.config(fg=ACCENT_GREEN)
+                selector.preview_label.config(text="Configured", fg=ACCENT_GREEN)
                 
                 if hasattr(selector, 'preview_image') and selector.preview_image:
                     try:
@@ -546,8 +622,8 @@ class PristonTaleBot:
                     except Exception as e:
                         logger.debug(f"Could not update preview image: {e}")
             else:
-                selector.status_dot.config(fg="#dc3545")
-                selector.preview_label.config(text="Not Configured", fg="#666666")
+                selector.status_dot.config(fg=ACCENT_RED)
+                selector.preview_label.config(text="Not Configured", fg=FG_DISABLED)
     
     def check_bar_config(self):
         configured_count = sum([
@@ -559,7 +635,7 @@ class PristonTaleBot:
         largato_configured = self.largato_skill_selector.is_setup()
         
         if configured_count >= 3:
-            self.config_status_label.config(text="Ready to start bot!", fg="#28a745")
+            self.config_status_label.config(text="Ready to start bot!", fg=ACCENT_GREEN)
             self.start_btn.config(state=tk.NORMAL)
             
             if largato_configured:
@@ -568,7 +644,7 @@ class PristonTaleBot:
             else:
                 self.config_status_label.config(text="Bot ready! Configure Largato skill bar for hunt mode.")
         else:
-            self.config_status_label.config(text=f"Configure {3-configured_count} more bar(s) to continue", fg="#ffc107")
+            self.config_status_label.config(text=f"Configure {3-configured_count} more bar(s) to continue", fg=ACCENT_YELLOW)
             self.start_btn.config(state=tk.DISABLED)
             self.largato_btn.config(state=tk.DISABLED)
         
@@ -584,8 +660,8 @@ class PristonTaleBot:
         self.stop_btn.config(state=tk.NORMAL)
         self.largato_btn.config(state=tk.DISABLED)
         
-        self.update_status("Running", "#28a745")
-        self._update_display()
+        self.update_status("Running", ACCENT_GREEN)
+        self._update_uptime()
     
     def stop_bot(self):
         self.log("Stopping bot...")
@@ -598,7 +674,7 @@ class PristonTaleBot:
         if self.largato_skill_selector.is_setup():
             self.largato_btn.config(state=tk.NORMAL)
         
-        self.update_status("Ready", "#28a745")
+        self.update_status("Ready", ACCENT_GREEN)
     
     def start_largato_hunt(self):
         self.log("Starting Largato Hunt...")
@@ -609,36 +685,53 @@ class PristonTaleBot:
         self.largato_btn.config(text="Stop Hunt", state=tk.NORMAL)
         self.stop_btn.config(state=tk.NORMAL)
         
-        self.update_status("Hunting", "#9c27b0")
-        self._update_display()
+        self.update_status("Hunting", ACCENT_PURPLE)
+        self._update_uptime()
     
     def reset_stats(self):
-        self.hp_potions_used = 0
-        self.mp_potions_used = 0
-        self.sp_potions_used = 0
-        self.spells_cast = 0
+        self.hp_potions_used.set(0)
+        self.mp_potions_used.set(0)
+        self.sp_potions_used.set(0)
+        self.spells_cast.set(0)
         self.start_time = None
-        
-        self.hp_potions_var.set("0")
-        self.mp_potions_var.set("0")
-        self.sp_potions_var.set("0")
-        self.spells_var.set("0")
+
         self.uptime_var.set("00:00:00")
         self.round_var.set("1")
-        
+
         self.log("Statistics reset")
     
     def save_settings(self):
+        self._request_config_save()
+
+    def _request_config_save(self):
+        """Mark the config dirty and write it at most once per 2 seconds.
+
+        Rapid setting changes coalesce into a single disk write; on_closing
+        bypasses the debounce and flushes immediately.
+        """
+        self._config_dirty = True
+        if not self._config_save_scheduled:
+            self._config_save_scheduled = True
+            self.root.after(2000, self._flush_config_save)
+
+    def _flush_config_save(self):
+        self._config_save_scheduled = False
+        if not self._config_dirty:
+            return
+        self._config_dirty = False
+
         try:
             self._save_configuration()
             self.log("Settings saved successfully")
         except Exception as e:
             self.log(f"Error saving settings: {e}")
     
-    def _update_display(self):
+    def _update_uptime(self):
+        # Counters refresh themselves through their Tk variables; the only
+        # value that needs a periodic tick is the uptime clock.
         if not (self.running or self.largato_running):
             return
-        
+
         try:
             if self.start_time:
                 uptime = time.time() - self.start_time
@@ -646,41 +739,75 @@ class PristonTaleBot:
                 minutes = int((uptime % 3600) // 60)
                 seconds = int(uptime % 60)
                 self.uptime_var.set(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
-            
-            self.hp_potions_var.set(str(self.hp_potions_used))
-            self.mp_potions_var.set(str(self.mp_potions_used))
-            self.sp_potions_var.set(str(self.sp_potions_used))
-            self.spells_var.set(str(self.spells_cast))
-            
         except Exception as e:
             logger.error(f"Error updating display: {e}")
-        
+
         if self.running or self.largato_running:
-            self.root.after(1000, self._update_display)
+            self.root.after(1000, self._update_uptime)
     
+    def post(self, fn):
+        """Queue fn to run on the Tk thread; safe to call from any thread.
+
+        Tk is not thread-safe, so worker threads must never touch widgets or
+        StringVars directly - they post closures here instead and the Tk
+        thread drains them in _drain_ui_queue.
+        """
+        self._ui_queue.put(fn)
+
+    def _drain_ui_queue(self):
+        while True:
+            try:
+                fn = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn()
+            except Exception as e:
+                logger.error(f"Error in posted UI callback: {e}")
+        self.root.after(50, self._drain_ui_queue)
+
     def update_status(self, text, color):
         self.status_indicator.config(fg=color)
         self.status_text.config(text=text, fg=color)
     
     def log(self, message):
-        timestamp = time.strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
+        self._log_queue.append(f"[{_now_hms()}] {message}\n")
         logger.info(message)
+
+        # Coalesce bursts (config load, bot start) into one insert+scroll so
+        # Tk does a single layout pass instead of one per message.
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after(100, self._flush_log)
+
+    def _flush_log(self):
+        self._log_flush_scheduled = False
+        if not self._log_queue:
+            return
+
+        text = "".join(self._log_queue)
+        self._log_queue.clear()
+
+        self.log_text.configure(state=tk.NORMAL)
+        self.log_text.insert(tk.END, text)
+
+        overflow = int(self.log_text.index('end-1c').split('.')[0]) - MAX_LOG_LINES
+        if overflow > 0:
+            self.log_text.delete('1.0', f'{overflow + 1}.0')
+
+        self.log_text.see(tk.END)
+        self.log_text.configure(state=tk.DISABLED)
     
     def _load_configuration(self):
         try:
             from app.config import load_config
             config = load_config()
-            
+            self._config_cache = config
+            self._config_mtime = self._get_config_mtime()
+
             bars_config = config.get("bars", {})
             
-            for bar_name, selector in [
-                ("health_bar", self.hp_bar_selector),
-                ("mana_bar", self.mp_bar_selector),
-                ("stamina_bar", self.sp_bar_selector),
-                ("largato_skill_bar", self.largato_skill_selector)
-            ]:
+            for bar_name, selector in self._bar_selectors:
                 bar_config = bars_config.get(bar_name, {})
                 if bar_config.get("configured", False):
                     x1 = bar_config.get("x1")
@@ -722,26 +849,35 @@ class PristonTaleBot:
         except Exception as e:
             logger.error(f"Error loading settings: {e}")
     
+    def _get_config_mtime(self):
+        try:
+            return os.path.getmtime('config.json')
+        except OSError:
+            return None
+
     def _save_configuration(self):
         try:
             from app.config import load_config, save_config
-            config = load_config()
-            
-            for bar_name, selector in [
-                ("health_bar", self.hp_bar_selector),
-                ("mana_bar", self.mp_bar_selector),
-                ("stamina_bar", self.sp_bar_selector),
-                ("largato_skill_bar", self.largato_skill_selector)
-            ]:
-                if selector.is_setup():
-                    config["bars"][bar_name] = {
-                        "x1": selector.x1,
-                        "y1": selector.y1,
-                        "x2": selector.x2,
-                        "y2": selector.y2,
-                        "configured": True
-                    }
-            
+
+            # Reuse the dict loaded at startup; only re-read the file if
+            # something else rewrote it since we last touched it.
+            config = self._config_cache
+            if config is None or self._get_config_mtime() != self._config_mtime:
+                config = load_config()
+                self._config_cache = config
+
+            config["bars"].update({
+                bar_name: {
+                    "x1": selector.x1,
+                    "y1": selector.y1,
+                    "x2": selector.x2,
+                    "y2": selector.y2,
+                    "configured": True
+                }
+                for bar_name, selector in self._bar_selectors
+                if selector.is_setup()
+            })
+
             config["potion_keys"] = {
                 "health": self.hp_key_var.get(),
                 "mana": self.mp_key_var.get(),
@@ -764,6 +900,7 @@ class PristonTaleBot:
             }
             
             save_config(config)
+            self._config_mtime = self._get_config_mtime()
             logger.info("Configuration saved successfully")
             
         except Exception as e:
@@ -774,7 +911,10 @@ class PristonTaleBot:
         try:
             if self.running or self.largato_running:
                 self.stop_bot()
-            
+
+            # Flush directly - any pending debounced save would fire after
+            # the window is gone.
+            self._config_dirty = False
             self._save_configuration()
             logger.info("Application closing gracefully")
             
@@ -1,6 +1,8 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
+import queue
+import threading
 import time
 from tkinter import Toplevel
 
@@ -105,6 +107,11 @@ class BotControllerUI:
         self.game_window = None
         self.game_window_rect = None
         self.game_hwnd = None
+
+        # Screenshot + detection run on a worker thread; only the resulting
+        # percentages cross back to the Tk thread through this queue.
+        self._cv_queue = queue.Queue(maxsize=4)
+        self._cv_thread = None
         
         self._create_ui()
         self._setup_keyboard_shortcuts()
@@ -308,9 +315,13 @@ class BotControllerUI:
                 self.largato_button.configure(state="disabled")
             
             self.bot_core.start()
+
+            self._cv_thread = threading.Thread(target=self._cv_worker, daemon=True)
+            self._cv_thread.start()
+
             self.set_status("Bot running...")
             self.log_callback("Potion bot started")
-            
+
             self._update_display()
             
         except Exception as e:
@@ -446,20 +457,50 @@ class BotControllerUI:
             self.log_callback(f"Error saving settings: {e}")
             logger.error(f"Error saving settings: {e}")
     
+    def _cv_worker(self):
+        """Capture and analyze the bars off the Tk thread.
+
+        Only the freshest sample matters for display, so the bounded queue
+        simply drops a stale entry when full.
+        """
+        while self.running:
+            try:
+                sample = (
+                    self.hp_bar.get_percentage(),
+                    self.mp_bar.get_percentage(),
+                    self.sp_bar.get_percentage()
+                )
+                try:
+                    self._cv_queue.put_nowait(sample)
+                except queue.Full:
+                    try:
+                        self._cv_queue.get_nowait()
+                        self._cv_queue.put_nowait(sample)
+                    except queue.Empty:
+                        pass
+            except Exception as e:
+                logger.error(f"Error in CV worker: {e}")
+            time.sleep(0.5)
+
     def _update_display(self):
         if not self.running and not self.largato_running:
             return
-        
+
         try:
             if self.running and self.bot_core:
-                hp_percent = self.hp_bar.get_percentage()
-                mp_percent = self.mp_bar.get_percentage()
-                sp_percent = self.sp_bar.get_percentage()
-                
-                self.hp_value_var.set(f"{hp_percent:.1f}%")
-                self.mp_value_var.set(f"{mp_percent:.1f}%")
-                self.sp_value_var.set(f"{sp_percent:.1f}%")
-                
+                sample = None
+                while True:
+                    try:
+                        sample = self._cv_queue.get_nowait()
+                    except queue.Empty:
+                        break
+
+                if sample:
+                    hp_percent, mp_percent, sp_percent = sample
+                    self.hp_value_var.set(f"{hp_percent:.1f}%")
+                    self.mp_value_var.set(f"{mp_percent:.1f}%")
+                    self.sp_value_var.set(f"{sp_percent:.1f}%")
+
                 self.hp_potions_var.set(str(self.bot_core.hp_potions_used))
                 self.mp_potions_var.set(str(self.bot_core.mp_potions_used))
                 self.sp_potions_var.set(str(self.bot_core.sp_potions_used))
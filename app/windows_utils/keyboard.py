@@ -113,6 +113,136 @@ def press_key(hwnd, key):
         logger.error(f"Error sending key '{key}': {e}", exc_info=True)
         return False
 
+def press_key_down(key):
+    """
+    Send only the key-down event via SendInput (hold the key)
+
+    Args:
+        key: Key to hold down
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        vk_code = get_virtual_key_code(key)
+        extra = ctypes.c_ulong(0)
+        ii_ = InputI()
+        ii_.ki = KeyBdInput(vk_code, 0, 0, 0, ctypes.pointer(extra))
+        x = Input(1, ii_)  # INPUT_KEYBOARD = 1
+        ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+        return True
+    except Exception as e:
+        logger.error(f"Error holding key '{key}': {e}", exc_info=True)
+        return False
+
+def press_key_up(key):
+    """
+    Send only the key-up event via SendInput (release a held key)
+
+    Args:
+        key: Key to release
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        vk_code = get_virtual_key_code(key)
+        KEYEVENTF_KEYUP = 0x0002
+        extra = ctypes.c_ulong(0)
+        ii_ = InputI()
+        ii_.ki = KeyBdInput(vk_code, 0, KEYEVENTF_KEYUP, 0, ctypes.pointer(extra))
+        x = Input(1, ii_)
+        ctypes.windll.user32.SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+        return True
+    except Exception as e:
+        logger.error(f"Error releasing key '{key}': {e}", exc_info=True)
+        return False
+
+def make_key_presser(key):
+    """
+    Resolve a key once and return a zero-argument presser for hot loops
+
+    The returned callable sends the key via SendInput with the virtual key
+    code, INPUT structures and bound SendInput already resolved, skipping
+    the per-call string lookup and info logging of press_key.
+
+    Args:
+        key: Key to pre-resolve (e.g., "x", "right")
+
+    Returns:
+        Callable sending one key press, returning True on success
+    """
+    vk_code = get_virtual_key_code(key)
+    INPUT_KEYBOARD = 1
+    KEYEVENTF_KEYUP = 0x0002
+    send_input = ctypes.windll.user32.SendInput
+
+    # Build the DOWN+UP pair once; SendInput takes the whole array in a
+    # single call, so each press is one syscall with no per-press struct
+    # allocation. The OS injects the two events in order.
+    extra = ctypes.c_ulong(0)
+    down = InputI()
+    down.ki = KeyBdInput(vk_code, 0, 0, 0, ctypes.pointer(extra))
+    up = InputI()
+    up.ki = KeyBdInput(vk_code, 0, KEYEVENTF_KEYUP, 0, ctypes.pointer(extra))
+    pair = (Input * 2)(Input(INPUT_KEYBOARD, down), Input(INPUT_KEYBOARD, up))
+    input_size = ctypes.sizeof(Input)
+
+    def presser():
+        try:
+            send_input(2, pair, input_size)
+            return True
+        except Exception as e:
+            logger.error(f"Error sending key '{key}': {e}")
+            return False
+
+    return presser
+
+def make_burst_presser(key, count):
+    """
+    Pre-build a fixed burst of key presses sent as one SendInput call
+
+    Movement phases fire short bursts (e.g. three forward taps) dozens of
+    times per round; building the full DOWN/UP event array once and handing
+    it to SendInput in a single call replaces 2*count syscalls plus the
+    Python sleeps that used to pad them. The OS injects the events in
+    order, so inter-event pacing is the kernel's job, not time.sleep's.
+
+    Args:
+        key: Key to press (e.g., "up")
+        count: Number of presses in the burst
+
+    Returns:
+        Callable sending the whole burst, returning True on success
+    """
+    vk_code = get_virtual_key_code(key)
+    INPUT_KEYBOARD = 1
+    KEYEVENTF_KEYUP = 0x0002
+    send_input = ctypes.windll.user32.SendInput
+
+    extra = ctypes.c_ulong(0)
+    events = []
+    for _ in range(count):
+        down = InputI()
+        down.ki = KeyBdInput(vk_code, 0, 0, 0, ctypes.pointer(extra))
+        up = InputI()
+        up.ki = KeyBdInput(vk_code, 0, KEYEVENTF_KEYUP, 0, ctypes.pointer(extra))
+        events.append(Input(INPUT_KEYBOARD, down))
+        events.append(Input(INPUT_KEYBOARD, up))
+    n_events = 2 * count
+    arr = (Input * n_events)(*events)
+    input_size = ctypes.sizeof(Input)
+
+    def presser():
+        try:
+            send_input(n_events, arr, input_size)
+            return True
+        except Exception as e:
+            logger.error(f"Error sending {count}x key '{key}' burst: {e}")
+            return False
+
+    return presser
+
 def send_key_combination(key1, key2):
     """
     Send a combination of two keys (like Ctrl+C)